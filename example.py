@@ -12,7 +12,7 @@ from datetime import datetime
 sys.path.insert(0, 'src')
 
 from httpwrapper import HTTPClient, AsyncHTTPClient
-from httpwrapper.config import RetryConfig, CircuitBreakerConfig, BackoffStrategy
+from httpwrapper.config import RetryConfig, CircuitBreakerConfig, BackoffStrategy, HTTPConfig
 
 
 def demo_sync_client():
@@ -38,10 +38,17 @@ def demo_sync_client():
         success_threshold=1
     )
 
+    # Size the connection pool so every request reuses a keep-alive connection
+    http_config = HTTPConfig(
+        connection_pool_size=4,
+        connection_pool_maxsize=4
+    )
+
     # Create HTTP client
     client = HTTPClient(
         retry_config=retry_config,
-        circuit_breaker_config=circuit_config
+        circuit_breaker_config=circuit_config,
+        http_config=http_config
     )
 
     urls_to_test = [
@@ -104,7 +111,13 @@ async def demo_async_client():
         jitter=False
     )
 
-    async with AsyncHTTPClient(retry_config=retry_config) as client:
+    # Allow up to 20 warm connections per host for the concurrent requests
+    http_config = HTTPConfig(
+        connection_pool_size=20,
+        connection_pool_maxsize=100
+    )
+
+    async with AsyncHTTPClient(retry_config=retry_config, http_config=http_config) as client:
         urls = [
             "https://httpbin.org/status/200",
             "https://httpbin.org/delay/1",  # 1 second delay
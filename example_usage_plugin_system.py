@@ -6,7 +6,15 @@ This example demonstrates how to use the plugin system to extend HTTPWrapper
 with custom functionality like rate limiting, metrics collection, and logging.
 """
 
+import contextlib
+import logging
+import logging.handlers
+import queue
+import sys
 import time
+
+from requests.adapters import HTTPAdapter
+
 from httpwrapper.config import HTTPWrapperConfig
 from httpwrapper.client import HTTPClient
 from httpwrapper.plugin_system import (
@@ -14,9 +22,119 @@ from httpwrapper.plugin_system import (
     MetricsPlugin,
     LoggingPlugin,
     RateLimitPlugin,
-    HTTPWrapperPlugin
+    HTTPWrapperPlugin,
+    PluginAdapter
 )
 
+# Per-request demo output shares the plugin logger's handlers
+logger = logging.getLogger('httpwrapper.plugin.demo')
+logger.setLevel(logging.INFO)
+
+# Banner separators used by the demos
+_BAR30 = "=" * 30
+_BAR35 = "=" * 35
+_BAR50 = "=" * 50
+_BAR60 = "=" * 60
+
+# Running byte totals wrap around at 64 bits
+_UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+# Canned bodies and headers shared by every mocked response
+_BODY_SUCCESS = b'{"message": "success"}' * 10
+_HEADERS_SUCCESS = {'content-type': 'application/json'}
+_JSON_SUCCESS = {'message': 'success'}
+
+_BODY_AUTH = b'{"data": "authenticated successfully"}' * 25
+_HEADERS_AUTH = {'content-type': 'application/json', 'x-api-version': '1.0'}
+_JSON_AUTH = {'data': 'authenticated successfully'}
+
+
+class MockResponse:
+    """
+    Lightweight stand-in for an HTTP response used by the demos.
+
+    Carries just enough of the requests.Response interface for
+    Session.send to accept it from a transport adapter.
+    """
+
+    __slots__ = ('status_code', 'content', 'headers', 'body_size', 'metadata', 'elapsed',
+                 '_json', '_start_time')
+
+    history = ()
+    is_redirect = False
+    raw = None
+
+    def __init__(self, status_code, content, headers, json_data):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self._json = json_data
+        # Defaults for the attributes ResponseSerializerPlugin fills in
+        self.body_size = 0
+        self.metadata = None
+
+    def json(self):
+        return self._json
+
+
+class MockTransport(HTTPAdapter):
+    """
+    Transport adapter that answers every request with a canned MockResponse.
+    """
+
+    def __init__(self, response_args, **kwargs):
+        super().__init__(**kwargs)
+        self._response_args = response_args
+
+    def send(self, request, **kwargs):
+        auth = request.headers.get('Authorization')
+        if auth:
+            logger.info("   ✅ Auth header received: %s...", auth[:20])
+        return MockResponse(*self._response_args)
+
+
+class MockPluginAdapter(PluginAdapter, MockTransport):
+    """
+    PluginAdapter running its plugins around MockTransport instead of the network.
+    """
+
+
+@contextlib.contextmanager
+def queued_plugin_logging():
+    """
+    Write plugin log records to stdout from a background thread.
+
+    Request threads only enqueue records. Leaving the block drains the
+    queue, so output printed afterwards follows the request output.
+    """
+    plugin_logger = logging.getLogger('httpwrapper.plugin')
+    log_queue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+
+    plugin_logger.addHandler(handler)
+    plugin_logger.propagate = False
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        plugin_logger.removeHandler(handler)
+        plugin_logger.propagate = True
+
+
+def mount_plugins(client, pm, response_args):
+    """Route every request made by the client through the plugin manager."""
+    adapter = MockPluginAdapter(
+        pm,
+        pool_connections=client.http_config.connection_pool_size,
+        pool_maxsize=client.http_config.connection_pool_maxsize,
+        response_args=response_args
+    )
+    client.session.mount('http://', adapter)
+    client.session.mount('https://', adapter)
+
 
 # Example of a custom plugin
 class AuthPlugin(HTTPWrapperPlugin):
@@ -34,21 +152,65 @@ class AuthPlugin(HTTPWrapperPlugin):
         self.api_key = config.get('api_key', '')
         self.auth_method = config.get('auth_method', 'Bearer')
 
-    def pre_request(self, method, url, **kwargs):
-        """Add authentication headers to requests."""
+        # The header never changes, so build it once up front
+        if self.auth_method == 'Bearer':
+            self._auth_header = ('Authorization', f'Bearer {self.api_key}')
+        elif self.auth_method == 'API-Key':
+            self._auth_header = ('X-API-Key', self.api_key)
+        else:
+            self._auth_header = None
+
+        self._disabled = not self.api_key or self._auth_header is None
         if not self.api_key:
             print("⚠️  Warning: No API key configured")
-            return kwargs
 
-        headers = kwargs.get('headers', {})
+    def pre_request(self, method, url, kwargs):
+        """Add authentication headers to requests."""
+        if self._disabled:
+            return
+
+        name, value = self._auth_header
+        headers = kwargs.get('headers')
+        if headers is None:
+            kwargs['headers'] = {name: value}
+        else:
+            headers[name] = value
+
+
+class _CountingReader:
+    """
+    Wraps a raw response stream and reports the size of every chunk read.
+    """
+
+    def __init__(self, raw, on_chunk):
+        self._raw = raw
+        self._on_chunk = on_chunk
+
+    def read(self, *args, **kwargs):
+        chunk = self._raw.read(*args, **kwargs)
+        self._on_chunk(len(chunk))
+        return chunk
+
+    def stream(self, *args, **kwargs):
+        for chunk in self._raw.stream(*args, **kwargs):
+            self._on_chunk(len(chunk))
+            yield chunk
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
 
-        if self.auth_method == 'Bearer':
-            headers['Authorization'] = f'Bearer {self.api_key}'
-        elif self.auth_method == 'API-Key':
-            headers['X-API-Key'] = self.api_key
 
-        kwargs['headers'] = headers
-        return kwargs
+class _RespMeta:
+    """
+    Metadata attached to responses by ResponseSerializerPlugin.
+    """
+
+    __slots__ = ('body_size', 'total_downloaded', 'serialized_at')
+
+    def __init__(self, body_size, total_downloaded, serialized_at):
+        self.body_size = body_size
+        self.total_downloaded = total_downloaded
+        self.serialized_at = serialized_at
 
 
 class ResponseSerializerPlugin(HTTPWrapperPlugin):
@@ -59,23 +221,73 @@ class ResponseSerializerPlugin(HTTPWrapperPlugin):
     def __init__(self):
         super().__init__()
         self.name = "response_serializer"
-        self.total_response_size = 0
+        self._total = 0
+
+    @property
+    def total_response_size(self):
+        """Total bytes seen across responses, as an unsigned 64-bit counter."""
+        return self._total
+
+    def _add_size(self, n):
+        self._total = (self._total + n) & _UINT64_MASK
 
     def initialize(self, config):
         """Initialize plugin."""
         pass
 
+    @staticmethod
+    def _declared_length(response):
+        """
+        Body size from Content-Length, when it matches the decoded body.
+
+        Encoded (e.g. gzip) bodies and HEAD responses are skipped, as their
+        header does not describe the bytes the caller reads.
+        """
+        headers = response.headers
+        if headers.get('content-encoding'):
+            return None
+        request = getattr(response, 'request', None)
+        if getattr(request, 'method', None) == 'HEAD':
+            return None
+        try:
+            size = int(headers.get('content-length'))
+        except (TypeError, ValueError):
+            return None
+        return size if size >= 0 else None
+
     def post_request(self, response):
         """Track response size and add metadata."""
-        response.body_size = len(getattr(response, 'content', b''))
-        self.total_response_size += response.body_size
+        raw = getattr(response, 'raw', None)
+        content = getattr(response, '_content', None)
+        if content is None and raw is None:
+            # Not a streaming response: whatever body it has is in memory
+            content = getattr(response, 'content', b'')
+
+        if isinstance(content, str):
+            response.body_size = len(content.encode())
+        elif content is not None and content is not False:
+            # nbytes gives the byte size of any buffer without copying it
+            response.body_size = memoryview(content).nbytes
+        else:
+            size = self._declared_length(response)
+            if size is not None:
+                response.body_size = size
+            elif raw is not None:
+                # Streamed body: count decoded bytes as the caller consumes them
+                response.body_size = 0
+
+                def on_chunk(n):
+                    response.body_size += n
+                    self._add_size(n)
+
+                response.raw = _CountingReader(raw, on_chunk)
+            else:
+                response.body_size = 0
+
+        self._add_size(response.body_size)
 
         # Add custom metadata
-        response.metadata = {
-            'body_size': response.body_size,
-            'total_downloaded': self.total_response_size,
-            'serialized_at': time.time()
-        }
+        response.metadata = _RespMeta(response.body_size, self.total_response_size, time.time_ns())
 
         return response
 
@@ -85,7 +297,7 @@ def demo_basic_plugins():
     Demonstrate basic plugin usage with built-in plugins.
     """
     print("🚀 HTTPWrapper Plugin System Demo")
-    print("=" * 50)
+    print(_BAR50)
 
     # Create plugin manager
     pm = PluginManager()
@@ -116,69 +328,47 @@ def demo_basic_plugins():
     # Simulate requests (we'll mock the actual HTTP calls)
     print("\n📊 Testing request pipeline with plugins...")
 
-    # Override the client's request method to use plugins
-    original_request = client.session.request
-
-    def enhanced_request(*args, **kwargs):
-        # Execute pre-request plugins
-        kwargs = pm.execute_pre_request(args[0], args[1], **kwargs)
-
-        try:
-            # Make the actual request (mocked for demo)
-            mock_response = type('MockResponse', (), {
-                'status_code': 200,
-                'json': lambda: {'message': 'success'},
-                'content': b'{"message": "success"}' * 10,  # Mock content
-                'headers': {'content-type': 'application/json'}
-            })()
-
-            # Execute post-request plugins
-            mock_response = pm.execute_post_request(mock_response)
-
-            return mock_response
-
-        except Exception as e:
-            # Execute error plugins
-            error = pm.execute_on_error(e, args[0], args[1])
-            if error:
-                raise error
-            return None
-
-    # Monkey patch for demo
-    client.session.request = enhanced_request
+    # Run the plugins inside the session's transport adapter
+    mount_plugins(client, pm, (200, _BODY_SUCCESS, _HEADERS_SUCCESS, _JSON_SUCCESS))
 
     # Test requests
-    for i in range(3):
-        print(f"\n🔄 Request {i+1}:")
-        try:
-            response = client.get("http://api.example.com/data")
-            if response:
-                print(f"   ✅ Status: {response.status_code}")
-                if hasattr(response, 'body_size'):
-                    print(f"   📏 Body size: {response.body_size} bytes")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-
-        # Show rate limiting
-        rate_limit_metrics = pm.get_plugin('rate_limit').get_metrics()
-        requests_in_window = rate_limit_metrics['rate_limit_metrics']['requests_in_window']
-        print(f"   🚦 Rate limit: {requests_in_window}/5 requests in window")
-
-        time.sleep(0.5)  # Small delay between requests
+    with queued_plugin_logging():
+        for i in range(3):
+            logger.info("\n🔄 Request %d:", i + 1)
+            try:
+                response = client.get("http://api.example.com/data")
+                if response:
+                    logger.info("   ✅ Status: %s", response.status_code)
+                    if response.body_size:
+                        logger.info("   📏 Body size: %s bytes", response.body_size)
+            except Exception as e:
+                logger.info("   ❌ Error: %s", e)
+
+            # Show rate limiting
+            rate_limit_metrics = pm.get_plugin('rate_limit').get_metrics()
+            requests_in_window = rate_limit_metrics['rate_limit_metrics']['requests_in_window']
+            logger.info("   🚦 Rate limit: %s/5 requests in window", requests_in_window)
+
+            time.sleep(0.5)  # Small delay between requests
 
     # Show final metrics
     print("\n📈 Final Plugin Metrics:")
     all_metrics = pm.get_all_metrics()
 
+    lines = []
     for plugin_name, metrics in all_metrics.items():
-        print(f"\n🔹 {plugin_name.upper()} PLUGIN:")
+        lines.append(f"\n🔹 {plugin_name.upper()} PLUGIN:")
         for key, value in metrics.items():
             if isinstance(value, dict):
-                print(f"   • {key}:")
+                lines.append(f"   • {key}:")
                 for sub_key, sub_value in value.items():
-                    print(".2f" if isinstance(sub_value, float) else f"      {sub_key}: {sub_value}")
+                    if isinstance(sub_value, float):
+                        lines.append(f"      {sub_key}: {sub_value:.2f}")
+                    else:
+                        lines.append(f"      {sub_key}: {sub_value}")
             else:
-                print(f"   • {key}: {value}")
+                lines.append(f"   • {key}: {value}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     pm.shutdown_all()
 
@@ -188,7 +378,7 @@ def demo_custom_plugins():
     Demonstrate custom plugin creation and integration.
     """
     print("\n\n🎨 Custom Plugin Demo")
-    print("=" * 30)
+    print(_BAR30)
 
     pm = PluginManager()
 
@@ -209,44 +399,21 @@ def demo_custom_plugins():
         cache_config=config.cache_config
     )
 
-    # Mock request method with custom plugin integration
-    def custom_request(*args, **kwargs):
-        print(f"\n🔐 Pre-request authorization check...")
-
-        # Execute pre-request plugins (auth plugin will add headers)
-        kwargs = pm.execute_pre_request(args[0], args[1], **kwargs)
-
-        # Check if auth header was added
-        headers = kwargs.get('headers', {})
-        if 'Authorization' in headers:
-            print(f"   ✅ Auth header added: {headers['Authorization'][:20]}...")
-
-        # Mock response
-        mock_response = type('MockResponse', (), {
-            'status_code': 200,
-            'json': lambda: {'data': 'authenticated successfully'},
-            'content': b'{"data": "authenticated successfully"}' * 25,
-            'headers': {'content-type': 'application/json', 'x-api-version': '1.0'}
-        })()
-
-        # Execute post-request plugins
-        mock_response = pm.execute_post_request(mock_response)
-
-        return mock_response
-
-    client.session.request = custom_request
+    # The auth plugin adds headers before the mock transport sees the request
+    mount_plugins(client, pm, (200, _BODY_AUTH, _HEADERS_AUTH, _JSON_AUTH))
 
     # Test request
     print("\n📤 Making authenticated request...")
-    response = client.get("https://api.example.com/secure")
+    with queued_plugin_logging():
+        response = client.get("https://api.example.com/secure")
 
     if response:
         print("   ✅ Response received")
-        if hasattr(response, 'metadata'):
-            metadata = response.metadata
+        metadata = response.metadata
+        if metadata is not None:
             print("   📊 Metadata added by plugin:")
-            print(f"      Body size: {metadata['body_size']} bytes")
-            print(f"      Serialized at: {time.ctime(metadata['serialized_at'])}")
+            print(f"      Body size: {metadata.body_size} bytes")
+            print(f"      Serialized at: {time.ctime(metadata.serialized_at / 1e9)}")
 
     pm.shutdown_all()
 
@@ -256,7 +423,7 @@ def demo_plugin_configuration():
     Demonstrate different plugin configurations and priority ordering.
     """
     print("\n\n⚙️  Plugin Configuration Demo")
-    print("=" * 35)
+    print(_BAR35)
 
     # Create multiple plugin managers with different configurations
     configs = [
@@ -307,7 +474,7 @@ def main():
         demo_custom_plugins()
         demo_plugin_configuration()
 
-        print("\n" + "="*60)
+        print("\n" + _BAR60)
         print("🎉 HTTPWrapper Plugin System Demo Complete!")
         print("The plugin system provides:")
         print("   • Extensible request/response pipeline")
@@ -315,7 +482,7 @@ def main():
         print("   • Built-in plugins for common functionality")
         print("   • Easy-to-create custom plugins")
         print("   • Comprehensive metrics and monitoring")
-        print("="*60)
+        print(_BAR60)
 
     except Exception as e:
         print(f"❌ Demo failed: {e}")
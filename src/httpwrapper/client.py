@@ -9,6 +9,7 @@ from urllib.parse import urlparse
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from .cache import CacheManager
 from .config import (
@@ -63,6 +64,7 @@ class HTTPClient:
 
         # Initialize core components
         self.session = session or requests.Session()
+        self.session_owner = session is None
         self.retry_manager = RetryManager(self.retry_config)
         self.circuit_breaker = CircuitBreaker(self.circuit_breaker_config)
         self.metrics = MetricsCollector()
@@ -85,6 +87,15 @@ class HTTPClient:
         if self.http_config.proxies:
             self.session.proxies.update(self.http_config.proxies)
 
+        # Size the connection pool so keep-alive connections are reused
+        if self.session_owner:
+            adapter = HTTPAdapter(
+                pool_connections=self.http_config.connection_pool_size,
+                pool_maxsize=self.http_config.connection_pool_maxsize,
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
     def _should_retry(self, response: Optional[Response], exception: Optional[Exception]) -> bool:
         """
         Determine if a request should be retried based on response or exception.
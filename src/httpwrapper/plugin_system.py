@@ -3,10 +3,39 @@ Plugin system for HTTPWrapper extensions.
 """
 
 import abc
+import collections
+import concurrent.futures
+import copy
+import functools
+import inspect
+import logging
+import math
+import operator
 import time
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type, TypeVar
 from dataclasses import dataclass
 
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+
+def _in_place_pre_request(hook: Callable) -> Callable:
+    """
+    Let an in-place pre_request hook also be called in the legacy form.
+
+    ``plugin.pre_request(method, url, **kwargs)`` runs the hook on those
+    keyword arguments and returns them, as the old contract did.
+    """
+    @functools.wraps(hook)
+    def wrapper(self: Any, method: str, url: str, kwargs: Optional[Dict[str, Any]] = None,
+                **legacy: Any) -> Optional[Dict[str, Any]]:
+        if kwargs is None:
+            hook(self, method, url, legacy)
+            return legacy
+        hook(self, method, url, kwargs)
+        return None
+
+    return wrapper
+
 
 class HTTPWrapperPlugin(abc.ABC):
     """
@@ -14,8 +43,14 @@ class HTTPWrapperPlugin(abc.ABC):
 
     Plugins can intercept and modify request/response processing
     at various points in the HTTP lifecycle.
+
+    Plugins whose pre_request hook does blocking I/O and does not depend on
+    other plugins may set ``independent = True``. Such hooks run concurrently
+    on their own copy of the request parameters.
     """
 
+    independent: bool = False
+
     def __init__(self):
         self.name: str = self.__class__.__name__
         self.priority: int = 100  # Lower priority runs first
@@ -30,19 +65,28 @@ class HTTPWrapperPlugin(abc.ABC):
         """
         pass
 
-    def pre_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+    def pre_request(self, method: str, url: str, kwargs: Optional[Dict[str, Any]] = None,
+                    **legacy) -> Optional[Dict[str, Any]]:
         """
         Called before making an HTTP request.
 
+        Plugins modify the request parameters in place. Plugins written
+        against the older ``pre_request(method, url, **kwargs)`` signature,
+        returning a new dict, are still supported by PluginManager, and may
+        keep returning ``super().pre_request(method, url, **kwargs)``.
+
         Args:
             method: HTTP method
             url: Request URL
-            **kwargs: Request parameters
+            kwargs: Request parameters, shared by every plugin in the chain
+            **legacy: Request parameters when called in the legacy form
 
         Returns:
-            Modified request parameters
+            None, or the legacy keyword arguments when called in the legacy form
         """
-        return kwargs
+        if kwargs is None:
+            return legacy
+        return None
 
     def post_request(self, response: Any) -> Any:
         """
@@ -96,15 +140,20 @@ class MetricsPlugin(HTTPWrapperPlugin):
         self.name = "metrics"
         self.request_count = 0
         self.error_count = 0
-        self.response_times: List[float] = []
+        self.max_response_times = 1000
+        # Response times in integer nanoseconds, oldest dropped automatically
+        self.response_times: Deque[int] = collections.deque(maxlen=self.max_response_times)
+        self._response_time_total = 0
         self.status_codes: Dict[int, int] = {}
 
     def initialize(self, config: Dict[str, Any]) -> None:
         self.max_response_times = config.get('max_response_times', 1000)
+        self.response_times = collections.deque(self.response_times, maxlen=self.max_response_times)
+        self._response_time_total = sum(self.response_times)
 
-    def pre_request(self, method: str, url: str, **kwargs):
-        kwargs['_start_time'] = time.time()
-        return kwargs
+    @_in_place_pre_request
+    def pre_request(self, method: str, url: str, kwargs: Dict[str, Any]) -> None:
+        kwargs['_start_time'] = time.monotonic_ns()
 
     def post_request(self, response: Any) -> Any:
         self.request_count += 1
@@ -115,10 +164,7 @@ class MetricsPlugin(HTTPWrapperPlugin):
 
         # Extract response time
         if hasattr(response, '_start_time'):
-            response_time = time.time() - response._start_time
-            self.response_times.append(response_time)
-            if len(self.response_times) > self.max_response_times:
-                self.response_times.pop(0)
+            self._record_response_time(time.monotonic_ns() - response._start_time)
 
         return response
 
@@ -126,15 +172,23 @@ class MetricsPlugin(HTTPWrapperPlugin):
         self.error_count += 1
         return error
 
-    def get_metrics(self) -> Dict[str, Any]:
-        avg_response_time = (sum(self.response_times) / len(self.response_times)
-                           if self.response_times else 0)
+    def _record_response_time(self, elapsed_ns: int) -> None:
+        times = self.response_times
+        if len(times) == times.maxlen:
+            self._response_time_total -= times[0]
+        times.append(elapsed_ns)
+        self._response_time_total += elapsed_ns
+
+    def _average_response_time(self) -> float:
+        return (self._response_time_total / len(self.response_times) / 1e9
+                if self.response_times else 0)
 
+    def get_metrics(self) -> Dict[str, Any]:
         return {
             'plugin_metrics': {
                 'total_requests': self.request_count,
                 'error_count': self.error_count,
-                'avg_response_time': avg_response_time,
+                'avg_response_time': self._average_response_time(),
                 'status_codes': self.status_codes.copy()
             }
         }
@@ -146,7 +200,6 @@ class LoggingPlugin(HTTPWrapperPlugin):
     """
 
     def __init__(self):
-        import logging
         super().__init__()
         self.name = "logging"
         self.logger = logging.getLogger('httpwrapper.plugin')
@@ -156,74 +209,231 @@ class LoggingPlugin(HTTPWrapperPlugin):
         level = config.get('log_level', 'INFO')
         self.logger.setLevel(getattr(self.logging, level))
 
-    def pre_request(self, method: str, url: str, **kwargs):
-        self.logger.info(f"Making {method} request to {url}")
-        return kwargs
+    @_in_place_pre_request
+    def pre_request(self, method: str, url: str, kwargs: Dict[str, Any]) -> None:
+        self.logger.info("Making %s request to %s", method, url)
 
     def post_request(self, response: Any) -> Any:
         status_code = getattr(response, 'status_code', 0)
-        self.logger.info(f"Received {status_code} response")
+        self.logger.info("Received %s response", status_code)
         return response
 
     def on_error(self, error: Exception, method: str, url: str):
-        self.logger.error(f"Request to {url} failed: {error}")
+        self.logger.error("Request to %s failed: %s", url, error)
         return error
 
 
 class RateLimitPlugin(HTTPWrapperPlugin):
     """
     Plugin that provides rate limiting capabilities.
+
+    The default ``token_bucket`` algorithm holds ``max_requests`` tokens that
+    refill at ``max_requests / window_seconds`` tokens per second. The
+    ``sliding_window`` algorithm weights the previous window's count by how
+    much of it still overlaps the current sliding window.
     """
 
+    ALGORITHMS = ('token_bucket', 'sliding_window')
+
     def __init__(self):
         super().__init__()
         self.name = "rate_limit"
         self.requests_per_minute = 60
-        self.requests_in_window: List[float] = []
+        self.max_requests = self.requests_per_minute
+        self.window_seconds = 60
+        self.algorithm = 'token_bucket'
+        self._reset_bucket()
 
     def initialize(self, config: Dict[str, Any]) -> None:
         self.requests_per_minute = config.get('requests_per_minute', 60)
         self.max_requests = config.get('max_requests', self.requests_per_minute)
         self.window_seconds = config.get('window_seconds', 60)
-
-    def pre_request(self, method: str, url: str, **kwargs):
-        import time
+        self.algorithm = config.get('algorithm', 'token_bucket')
+        if self.algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unsupported rate limit algorithm: {self.algorithm}")
+        self._reset_bucket()
+
+    def _reset_bucket(self) -> None:
+        now = time.monotonic()
+        self.capacity = float(self.max_requests)
+        self.tokens = self.capacity
+        self.refill_rate = self.max_requests / self.window_seconds
+        self.last_refill = now
+        self.prev = 0
+        self.curr = 0
+        self.win_start = now
+
+    def _roll_window(self, now: float) -> float:
+        """Advance the fixed window if needed and return the elapsed time in it."""
+        elapsed = now - self.win_start
+        if elapsed >= self.window_seconds:
+            windows = elapsed // self.window_seconds
+            self.prev = self.curr if windows == 1 else 0
+            self.curr = 0
+            self.win_start += self.window_seconds * windows
+            elapsed = now - self.win_start
+        return elapsed
+
+    def _window_estimate(self, elapsed: float) -> float:
+        return self.prev * max(0.0, 1 - elapsed / self.window_seconds) + self.curr
+
+    @_in_place_pre_request
+    def pre_request(self, method: str, url: str, kwargs: Dict[str, Any]) -> None:
         try:
             from ..exceptions import RateLimitError
         except ImportError:
             from httpwrapper.exceptions import RateLimitError
 
-        now = time.time()
+        now = time.monotonic()
 
-        # Clean old requests outside the window
-        cutoff = now - self.window_seconds
-        self.requests_in_window = [t for t in self.requests_in_window if t > cutoff]
+        if self.algorithm == 'sliding_window':
+            elapsed = self._roll_window(now)
+            if self._window_estimate(elapsed) >= self.max_requests:
+                retry_after = self.window_seconds - elapsed
+                raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
+            self.curr += 1
+            return
 
-        # Check if we're over the limit
-        if len(self.requests_in_window) >= self.max_requests:
-            retry_after = self.requests_in_window[0] + self.window_seconds - now
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+        if self.tokens < 1:
+            retry_after = (1 - self.tokens) / self.refill_rate
             raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
 
-        # Add current request timestamp
-        self.requests_in_window.append(now)
-        return kwargs
+        self.tokens -= 1
+
+    @property
+    def requests_in_window(self) -> int:
+        """Number of requests currently counted against the limit."""
+        if self.algorithm == 'sliding_window':
+            return int(self._window_estimate(self._roll_window(time.monotonic())))
+        elapsed = time.monotonic() - self.last_refill
+        tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        return math.ceil(self.capacity - tokens)
 
     def get_metrics(self) -> Dict[str, Any]:
         return {
             'rate_limit_metrics': {
-                'requests_in_window': len(self.requests_in_window),
+                'requests_in_window': self.requests_in_window,
                 'max_requests': self.max_requests
             }
         }
 
 
+def _pre_request_hook(plugin: HTTPWrapperPlugin) -> Callable[[str, str, Dict[str, Any]], None]:
+    """
+    Get a callable running a plugin's pre_request hook in place.
+
+    Legacy hooks declared as ``pre_request(method, url, **kwargs)`` return a
+    new dict, which is copied back into the shared request parameters.
+
+    Args:
+        plugin: Plugin whose hook should be wrapped
+
+    Returns:
+        Callable taking (method, url, kwargs) and returning None
+    """
+    hook = plugin.pre_request
+    parameters = inspect.signature(hook).parameters.values()
+    positional = sum(
+        p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        for p in parameters
+    )
+    if positional >= 3 or not any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return hook
+
+    def legacy_hook(method: str, url: str, kwargs: Dict[str, Any]) -> None:
+        result = hook(method, url, **kwargs)
+        kwargs.clear()
+        kwargs.update(result)
+
+    return legacy_hook
+
+
+def _isolated(value: Any) -> Any:
+    """
+    Deep-copy a dict, list or set so concurrent hooks don't share it.
+
+    Other values, and containers that cannot be copied, are returned as is.
+    """
+    if isinstance(value, (dict, list, set)):
+        try:
+            return copy.deepcopy(value)
+        except (TypeError, copy.Error):
+            pass
+    return value
+
+
+def _apply_changes(target: Dict[str, Any], before: Dict[str, Any], after: Dict[str, Any]) -> None:
+    """
+    Apply the keys added, replaced or removed between two snapshots to a dict.
+
+    Nested dicts changed on both sides are merged key by key.
+
+    Args:
+        target: Dict to update
+        before: Snapshot a hook started from
+        after: The hook's copy once it returned
+    """
+    for key, value in after.items():
+        if key not in before:
+            target[key] = value
+            continue
+        old = before[key]
+        if value is old or value == old:
+            continue
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(old, dict) and isinstance(current, dict):
+            _apply_changes(current, old, value)
+        else:
+            target[key] = value
+    for key in before.keys() - after.keys():
+        target.pop(key, None)
+
+
 class PluginManager:
     """
     Manages HTTPWrapper plugins.
+
+    Hook chains are built when plugins are registered or unregistered, when
+    a new list is assigned to ``plugins``, and on the next dispatch after
+    plugins are added to or removed from ``plugins`` in place. Call
+    sort_plugins() after changing a registered plugin's priority or
+    replacing an entry of ``plugins``; callers that read the chains
+    directly should call ensure_sorted() first.
+
+    Pre-request hooks run in priority order. Consecutive independent hooks
+    form a group that runs concurrently at that point in the order, each on
+    its own copy of the request parameters in which dict, list and set
+    values are deep-copied; other mutable objects are still shared.
     """
 
     def __init__(self):
-        self.plugins: List[HTTPWrapperPlugin] = []
+        self.plugins = []
+        self._by_name: Dict[str, HTTPWrapperPlugin] = {}
+        self._pre_chain: Tuple[HTTPWrapperPlugin, ...] = ()
+        self._post_chain: Tuple[HTTPWrapperPlugin, ...] = ()
+        self._error_chain: Tuple[HTTPWrapperPlugin, ...] = ()
+        # Serial hooks, and tuples of consecutive independent hooks, in priority order
+        self._pre_stages: Tuple[Any, ...] = ()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # Whether any plugin implements each phase; callers may skip a phase entirely
+        self.has_pre = False
+        self.has_post = False
+        self.has_error = False
+        self._sorted = False
+        # Length of ``plugins`` when last sorted, to spot in-place additions and removals
+        self._sorted_count = 0
+
+    @property
+    def plugins(self) -> List[HTTPWrapperPlugin]:
+        """Registered plugins, in priority order once sorted."""
+        return self._plugins
+
+    @plugins.setter
+    def plugins(self, plugins: List[HTTPWrapperPlugin]) -> None:
+        self._plugins = plugins
         self._sorted = False
 
     def register_plugin(self, plugin_class: Type[HTTPWrapperPlugin], config: Dict[str, Any] = None) -> None:
@@ -237,7 +447,7 @@ class PluginManager:
         plugin = plugin_class()
         plugin.initialize(config or {})
         self.plugins.append(plugin)
-        self._sorted = False
+        self.sort_plugins()
         print(f"Plugin '{plugin.name}' registered successfully")
 
     def unregister_plugin(self, plugin_name: str) -> None:
@@ -247,13 +457,14 @@ class PluginManager:
         Args:
             plugin_name: Name of the plugin to remove
         """
-        for plugin in self.plugins:
-            if plugin.name == plugin_name:
-                plugin.shutdown()
-                self.plugins.remove(plugin)
-                self._sorted = True
-                print(f"Plugin '{plugin_name}' unregistered")
-                break
+        self.ensure_sorted()
+
+        plugin = self._by_name.get(plugin_name)
+        if plugin is not None:
+            plugin.shutdown()
+            self.plugins.remove(plugin)
+            self.sort_plugins()
+            print(f"Plugin '{plugin_name}' unregistered")
 
     def get_plugins(self) -> List[HTTPWrapperPlugin]:
         """Get all registered plugins."""
@@ -261,42 +472,122 @@ class PluginManager:
 
     def get_plugin(self, name: str) -> Optional[HTTPWrapperPlugin]:
         """Get a plugin by name."""
-        for plugin in self.plugins:
-            if plugin.name == name:
-                return plugin
-        return None
+        self.ensure_sorted()
+        return self._by_name.get(name)
+
+    def ensure_sorted(self) -> None:
+        """Rebuild the name index and hook chains if the plugin list changed."""
+        if not self._sorted or len(self._plugins) != self._sorted_count:
+            self.sort_plugins()
 
     def sort_plugins(self) -> None:
-        """Sort plugins by priority."""
-        self.plugins.sort(key=lambda p: p.priority)
+        """Sort plugins by priority and rebuild the name index and hook chains."""
+        self.plugins.sort(key=operator.attrgetter('priority'))
+
+        # Reversed so the first plugin with a given name wins, as with a list scan
+        self._by_name = {p.name: p for p in reversed(self.plugins)}
+
+        # Only keep plugins that actually override a hook in its chain
+        for p in self.plugins:
+            plugin_type = type(p)
+            p._has_pre = plugin_type.pre_request is not HTTPWrapperPlugin.pre_request
+            p._has_post = plugin_type.post_request is not HTTPWrapperPlugin.post_request
+            p._has_error = plugin_type.on_error is not HTTPWrapperPlugin.on_error
+
+        self._pre_chain = tuple(p for p in self.plugins if p._has_pre)
+        self._post_chain = tuple(p for p in self.plugins if p._has_post)
+        self._error_chain = tuple(p for p in self.plugins if p._has_error)
+        self.has_pre = bool(self._pre_chain)
+        self.has_post = bool(self._post_chain)
+        self.has_error = bool(self._error_chain)
+        stages: List[Any] = []
+        for p in self._pre_chain:
+            hook = _pre_request_hook(p)
+            if not p.independent:
+                stages.append(hook)
+            elif stages and isinstance(stages[-1], tuple):
+                stages[-1] += (hook,)
+            else:
+                stages.append((hook,))
+        self._pre_stages = tuple(stages)
+        self._sorted_count = len(self.plugins)
         self._sorted = True
 
     def execute_pre_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
         """Execute pre-request hooks."""
-        if not self._sorted:
-            self.sort_plugins()
+        self.ensure_sorted()
 
-        for plugin in self.plugins:
-            kwargs = plugin.pre_request(method, url, **kwargs)
+        for stage in self._pre_stages:
+            if type(stage) is tuple:
+                self._execute_parallel(stage, method, url, kwargs)
+            else:
+                stage(method, url, kwargs)
 
         return kwargs
 
+    def _execute_parallel(self, hooks: Tuple[Callable[[str, str, Dict[str, Any]], None], ...],
+                          method: str, url: str, kwargs: Dict[str, Any]) -> None:
+        """
+        Run a group of independent pre-request hooks concurrently and merge their results.
+
+        Each hook works on its own copy of the request parameters, with
+        nested containers deep-copied when more than one hook runs. Only the
+        keys a hook added, replaced or removed relative to the shared
+        parameters are applied back; headers and other nested dicts are
+        merged key by key.
+        """
+        isolate = len(hooks) > 1
+        before = {
+            key: _isolated(value) if isolate else value
+            for key, value in kwargs.items() if key != 'headers'
+        }
+        before_headers = dict(kwargs.get('headers') or {})
+
+        copies = []
+        for _ in hooks:
+            params = {
+                key: _isolated(value) if isolate else value
+                for key, value in before.items()
+            }
+            params['headers'] = dict(before_headers)
+            copies.append(params)
+
+        if not isolate:
+            hooks[0](method, url, copies[0])
+        else:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix='httpwrapper-plugin'
+                )
+            futures = [
+                self._executor.submit(hook, method, url, params)
+                for hook, params in zip(hooks, copies)
+            ]
+            for future in futures:
+                future.result()
+
+        for params in copies:
+            headers = params.pop('headers', None)
+            _apply_changes(kwargs, before, params)
+            if headers is not None and headers != before_headers:
+                if kwargs.get('headers') is None:
+                    kwargs['headers'] = {}
+                _apply_changes(kwargs['headers'], before_headers, headers)
+
     def execute_post_request(self, response: Any) -> Any:
         """Execute post-request hooks."""
-        if not self._sorted:
-            self.sort_plugins()
+        self.ensure_sorted()
 
-        for plugin in self.plugins:
+        for plugin in self._post_chain:
             response = plugin.post_request(response)
 
         return response
 
     def execute_on_error(self, error: Exception, method: str, url: str) -> Optional[Exception]:
         """Execute error hooks."""
-        if not self._sorted:
-            self.sort_plugins()
+        self.ensure_sorted()
 
-        for plugin in self.plugins:
+        for plugin in self._error_chain:
             error = plugin.on_error(error, method, url)
             if error is None:
                 break
@@ -317,6 +608,73 @@ class PluginManager:
         for plugin in self.plugins:
             plugin.shutdown()
         self.plugins.clear()
+        self.sort_plugins()
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class PluginAdapter(HTTPAdapter):
+    """
+    Transport adapter that runs a PluginManager's hooks around every request.
+
+    Mount it on a requests Session (``session.mount('https://', adapter)``)
+    to apply the plugins to all requests sent through that session. Pass
+    the session's pool sizes (e.g. HTTPConfig.connection_pool_size and
+    connection_pool_maxsize) so mounting doesn't shrink its connection pool.
+
+    Hooks run once per transport send: every redirect hop, and every retry
+    the session or client makes, passes through the pre and post hooks and
+    counts against limits such as RateLimitPlugin's. The request is already
+    prepared at this point, so pre hooks can change its headers and the
+    transport options (timeout, verify, proxies, ...); other keys such as
+    ``params``, ``json`` or ``data`` are not applied. Error hooks may
+    replace the raised exception; returning None leaves the original
+    exception in place, since a transport must return a response.
+    """
+
+    def __init__(self, plugin_manager: PluginManager, pool_connections: int = DEFAULT_POOLSIZE,
+                 pool_maxsize: int = DEFAULT_POOLSIZE, **kwargs):
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, **kwargs)
+        self.plugin_manager = plugin_manager
+
+    def send(self, request, **kwargs):
+        manager = self.plugin_manager
+        method, url = request.method, request.url
+        params = None
+        manager.ensure_sorted()
+
+        try:
+            if manager.has_pre:
+                params = manager.execute_pre_request(method, url, headers=request.headers, **kwargs)
+                headers = params.get('headers')
+                if headers is not None and headers is not request.headers:
+                    request.headers.update(headers)
+                # Only hand transport options back; plugins may add private keys
+                kwargs = {key: params[key] for key in kwargs if key in params}
+
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            if not manager.has_error:
+                raise
+            error = manager.execute_on_error(e, method, url)
+            if error is None or error is e:
+                raise
+            raise error from e
+
+        if params:
+            # Private keys (e.g. MetricsPlugin's _start_time) travel on the response
+            for key, value in params.items():
+                if key.startswith('_'):
+                    try:
+                        setattr(response, key, value)
+                    except AttributeError:
+                        pass
+
+        if manager.has_post:
+            response = manager.execute_post_request(response)
+        return response
 
 
 # Global plugin manager instance
@@ -8,6 +8,8 @@ from unittest.mock import Mock, patch, MagicMock
 from urllib.parse import urljoin
 import time
 
+import requests
+
 from httpwrapper.client import HTTPClient
 from httpwrapper.config import HTTPWrapperConfig
 from httpwrapper.exceptions import (
@@ -45,6 +47,25 @@ class TestHTTPClientInitialization(unittest.TestCase):
         # Session should have timeout configured
         self.assertIsNotNone(client.session.timeout)
 
+    def test_session_connection_pool(self):
+        """Test that owned sessions use the configured connection pool size."""
+        config = HTTPWrapperConfig()
+        config.http_config.connection_pool_size = 4
+        config.http_config.connection_pool_maxsize = 8
+        client = HTTPClient(http_config=config.http_config)
+
+        adapter = client.session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 8)
+
+    def test_custom_session_adapters_untouched(self):
+        """Test that a caller-provided session keeps its own adapters."""
+        session = requests.Session()
+        adapter = session.get_adapter("https://example.com")
+        client = HTTPClient(session=session)
+
+        self.assertIs(client.session.get_adapter("https://example.com"), adapter)
+
 
 class TestHTTPClientRequestMethods(unittest.TestCase):
     """Test all HTTP request methods."""
@@ -6,11 +6,15 @@ import unittest
 from unittest.mock import Mock, patch
 import time
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from httpwrapper.plugin_system import (
     HTTPWrapperPlugin,
     MetricsPlugin,
     LoggingPlugin,
     RateLimitPlugin,
+    PluginAdapter,
     PluginManager
 )
 
@@ -48,8 +52,9 @@ class TestHTTPWrapperPlugin(unittest.TestCase):
 
         plugin = TestPlugin()
 
-        # These should not raise exceptions and return input unchanged
-        kwargs = plugin.pre_request("GET", "http://example.com")
+        # These should not raise exceptions and leave input unchanged
+        kwargs = {}
+        self.assertIsNone(plugin.pre_request("GET", "http://example.com", kwargs))
         self.assertEqual(kwargs, {})
 
         response = plugin.post_request("mock_response")
@@ -82,7 +87,8 @@ class TestMetricsPlugin(unittest.TestCase):
 
     def test_metrics_plugin_pre_request(self):
         """Test pre_request metric tracking."""
-        kwargs = self.plugin.pre_request("GET", "http://example.com")
+        kwargs = {}
+        self.plugin.pre_request("GET", "http://example.com", kwargs)
         self.assertIn('_start_time', kwargs)
 
     def test_metrics_plugin_post_request(self):
@@ -93,13 +99,53 @@ class TestMetricsPlugin(unittest.TestCase):
         # Mock response
         response = Mock()
         response.status_code = 200
-        response._start_time = time.time() - 0.1
+        response._start_time = time.monotonic_ns() - 100_000_000
 
         self.plugin.post_request(response)
 
         self.assertEqual(self.plugin.request_count, 1)
         self.assertEqual(self.plugin.status_codes[200], 1)
         self.assertEqual(len(self.plugin.response_times), 1)
+        self.assertGreaterEqual(self.plugin.response_times[0], 100_000_000)
+
+    def test_metrics_plugin_response_times_bounded(self):
+        """Test that only the most recent response times are kept."""
+        self.plugin.initialize({'max_response_times': 2})
+
+        for start in (3, 2, 1):
+            response = Mock()
+            response.status_code = 200
+            response._start_time = time.monotonic_ns() - start * 1_000_000
+            self.plugin.post_request(response)
+
+        self.assertEqual(len(self.plugin.response_times), 2)
+        self.assertLess(self.plugin.response_times[-1], self.plugin.response_times[0])
+
+    def test_metrics_plugin_running_average(self):
+        """Test that the average follows new and evicted responses."""
+        self.plugin.initialize({})
+        for elapsed in (100_000_000, 300_000_000):
+            self.plugin._record_response_time(elapsed)
+
+        first = self.plugin.get_metrics()
+        self.plugin.request_count = 7
+        second = self.plugin.get_metrics()
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second['plugin_metrics']['total_requests'], 7)
+        self.assertAlmostEqual(second['plugin_metrics']['avg_response_time'], 0.2)
+
+        response = Mock()
+        response.status_code = 200
+        response._start_time = time.monotonic_ns() - 1_100_000_000
+        self.plugin.post_request(response)
+
+        self.assertGreater(self.plugin.get_metrics()['plugin_metrics']['avg_response_time'], 0.4)
+
+        self.plugin.initialize({'max_response_times': 2})
+        self.plugin._record_response_time(500_000_000)
+        self.assertEqual(len(self.plugin.response_times), 2)
+        self.assertEqual(self.plugin._response_time_total, sum(self.plugin.response_times))
 
     def test_metrics_plugin_error_tracking(self):
         """Test error tracking in plugin."""
@@ -114,7 +160,8 @@ class TestMetricsPlugin(unittest.TestCase):
         # Set up some data
         self.plugin.request_count = 5
         self.plugin.error_count = 1
-        self.plugin.response_times = [0.1, 0.2, 0.15]
+        for elapsed in (100_000_000, 200_000_000, 150_000_000):
+            self.plugin._record_response_time(elapsed)
         self.plugin.status_codes = {200: 3, 404: 1, 500: 1}
 
         metrics = self.plugin.get_metrics()
@@ -151,7 +198,8 @@ class TestLoggingPlugin(unittest.TestCase):
         with patch.object(self.plugin.logger, 'info'):
             with patch.object(self.plugin.logger, 'error'):
                 # Test pre_request
-                kwargs = self.plugin.pre_request("GET", "http://example.com")
+                kwargs = {}
+                self.plugin.pre_request("GET", "http://example.com", kwargs)
                 self.assertEqual(kwargs, {})
 
                 # Test post_request
@@ -191,8 +239,8 @@ class TestRateLimitPlugin(unittest.TestCase):
         self.plugin.initialize({'max_requests': 2, 'window_seconds': 1})
 
         # Should not raise exception
-        kwargs = self.plugin.pre_request("GET", "http://example.com")
-        self.assertEqual(len(self.plugin.requests_in_window), 1)
+        self.plugin.pre_request("GET", "http://example.com", {})
+        self.assertEqual(self.plugin.requests_in_window, 1)
 
     def test_rate_limit_plugin_over_limit(self):
         """Test rate limiting when over the limit."""
@@ -201,34 +249,105 @@ class TestRateLimitPlugin(unittest.TestCase):
         self.plugin.initialize({'max_requests': 1, 'window_seconds': 1})
 
         # First request should succeed
-        self.plugin.pre_request("GET", "http://example.com")
+        self.plugin.pre_request("GET", "http://example.com", {})
 
         # Second request should fail
         with self.assertRaises(RateLimitError):
-            self.plugin.pre_request("GET", "http://example.com")
+            self.plugin.pre_request("GET", "http://example.com", {})
 
     def test_rate_limit_plugin_window_cleanup(self):
-        """Test cleanup of old requests from the window."""
+        """Test that the bucket refills once the window has passed."""
         import time
 
         self.plugin.initialize({'max_requests': 2, 'window_seconds': 0.1})
 
         # Add a request
-        self.plugin.pre_request("GET", "http://example.com")
+        self.plugin.pre_request("GET", "http://example.com", {})
 
         # Wait for window to expire
         time.sleep(0.15)
 
         # Add another request - should succeed
-        self.plugin.pre_request("GET", "http://example.com")
+        self.plugin.pre_request("GET", "http://example.com", {})
+
+        # Only the latest request should still hold a token
+        self.assertEqual(self.plugin.requests_in_window, 1)
+
+    def test_rate_limit_plugin_retry_after(self):
+        """Test that retry_after reflects the time until the next token."""
+        from httpwrapper.exceptions import RateLimitError
+
+        self.plugin.initialize({'max_requests': 1, 'window_seconds': 10})
+        self.plugin.pre_request("GET", "http://example.com", {})
+
+        with self.assertRaises(RateLimitError) as ctx:
+            self.plugin.pre_request("GET", "http://example.com", {})
+
+        self.assertGreater(ctx.exception.retry_after, 9)
+        self.assertLessEqual(ctx.exception.retry_after, 10)
+
+    def test_token_bucket_refills_on_read(self):
+        """Test that idle time is reflected in the reported window count."""
+        self.plugin.initialize({'max_requests': 5, 'window_seconds': 10})
+        for _ in range(5):
+            self.plugin.pre_request("GET", "http://example.com", {})
+        self.assertEqual(self.plugin.requests_in_window, 5)
+
+        tokens = self.plugin.tokens
+        with patch('httpwrapper.plugin_system.time.monotonic',
+                   return_value=self.plugin.last_refill + 1000):
+            self.assertEqual(self.plugin.requests_in_window, 0)
+            self.assertEqual(self.plugin.get_metrics()['rate_limit_metrics']['requests_in_window'], 0)
+
+        # Reading does not consume or refill the bucket
+        self.assertEqual(self.plugin.tokens, tokens)
 
-        # Should have cleaned up the old request
-        self.assertEqual(len(self.plugin.requests_in_window), 1)
+    def test_rate_limit_plugin_invalid_algorithm(self):
+        """Test that unknown algorithms are rejected."""
+        with self.assertRaises(ValueError):
+            self.plugin.initialize({'algorithm': 'leaky_bucket'})
+
+    def test_sliding_window_over_limit(self):
+        """Test sliding window rejects requests over the limit."""
+        from httpwrapper.exceptions import RateLimitError
+
+        self.plugin.initialize({'max_requests': 2, 'window_seconds': 10, 'algorithm': 'sliding_window'})
+
+        self.plugin.pre_request("GET", "http://example.com", {})
+        self.plugin.pre_request("GET", "http://example.com", {})
+        self.assertEqual(self.plugin.requests_in_window, 2)
+
+        with self.assertRaises(RateLimitError):
+            self.plugin.pre_request("GET", "http://example.com", {})
+
+    def test_sliding_window_weights_previous_window(self):
+        """Test that the previous window count decays as it slides out."""
+        self.plugin.initialize({'max_requests': 10, 'window_seconds': 10, 'algorithm': 'sliding_window'})
+        self.plugin.curr = 8
+
+        with patch('httpwrapper.plugin_system.time.monotonic', return_value=self.plugin.win_start + 12.5):
+            # One window has passed: 8 requests weighted by the 75% overlap
+            self.assertEqual(self.plugin.requests_in_window, 6)
+
+        with patch('httpwrapper.plugin_system.time.monotonic', return_value=self.plugin.win_start + 25):
+            # Two full windows have passed: nothing is left
+            self.assertEqual(self.plugin.requests_in_window, 0)
+
+    def test_rate_limit_plugin_metrics_fresh(self):
+        """Test that rate limit metrics reflect the latest state."""
+        self.plugin.initialize({'max_requests': 5})
+        self.assertEqual(self.plugin.get_metrics()['rate_limit_metrics']['requests_in_window'], 0)
+
+        self.plugin.pre_request("GET", "http://example.com", {})
+        self.assertEqual(self.plugin.get_metrics()['rate_limit_metrics']['requests_in_window'], 1)
+
+        self.plugin.initialize({'max_requests': 99})
+        self.assertEqual(self.plugin.get_metrics()['rate_limit_metrics']['max_requests'], 99)
 
     def test_rate_limit_plugin_metrics(self):
         """Test rate limit plugin metrics."""
-        self.plugin.requests_in_window = [1.0, 2.0]
-        self.plugin.max_requests = 10
+        self.plugin.initialize({'max_requests': 10})
+        self.plugin.tokens = 8.0
 
         metrics = self.plugin.get_metrics()
 
@@ -249,6 +368,20 @@ class TestPluginManager(unittest.TestCase):
         self.assertEqual(len(self.manager.plugins), 0)
         self.assertFalse(self.manager._sorted)
 
+    def test_phase_flags(self):
+        """Test that phase flags follow plugin registration."""
+        self.assertFalse(self.manager.has_pre)
+        self.assertFalse(self.manager.has_post)
+        self.assertFalse(self.manager.has_error)
+
+        self.manager.register_plugin(MetricsPlugin)
+        self.assertTrue(self.manager.has_pre)
+        self.assertTrue(self.manager.has_post)
+        self.assertTrue(self.manager.has_error)
+
+        self.manager.unregister_plugin("metrics")
+        self.assertFalse(self.manager.has_pre)
+
     def test_register_plugin(self):
         """Test plugin registration."""
         self.manager.register_plugin(MetricsPlugin, {'max_response_times': 100})
@@ -277,6 +410,30 @@ class TestPluginManager(unittest.TestCase):
         nonexistent = self.manager.get_plugin("nonexistent")
         self.assertIsNone(nonexistent)
 
+    def test_get_plugin_after_unregister(self):
+        """Test that name lookups follow registration changes."""
+        self.manager.register_plugin(MetricsPlugin)
+        self.manager.register_plugin(LoggingPlugin)
+
+        self.manager.unregister_plugin("metrics")
+
+        self.assertIsNone(self.manager.get_plugin("metrics"))
+        self.assertEqual(self.manager.get_plugin("logging").name, "logging")
+
+    def test_unregister_after_assigning_plugins(self):
+        """Test that unregistering uses the newly assigned plugin list."""
+        self.manager.register_plugin(MetricsPlugin)
+        old_metrics = self.manager.get_plugin("metrics")
+        new_metrics = MetricsPlugin()
+        self.manager.plugins = [new_metrics]
+
+        with patch.object(old_metrics, 'shutdown') as old_shutdown:
+            self.manager.unregister_plugin("metrics")
+
+        old_shutdown.assert_not_called()
+        self.assertEqual(self.manager.plugins, [])
+        self.assertIsNone(self.manager.get_plugin("metrics"))
+
     def test_get_plugins(self):
         """Test getting all plugins."""
         self.manager.register_plugin(MetricsPlugin)
@@ -305,6 +462,64 @@ class TestPluginManager(unittest.TestCase):
         self.assertEqual(self.manager.plugins[0].priority, 50)
         self.assertEqual(self.manager.plugins[1].priority, 200)
 
+    def test_assigned_plugins_rebuild_chains(self):
+        """Test that assigning a plugin list is picked up on the next dispatch."""
+        self.manager.register_plugin(LoggingPlugin)
+        self.manager.plugins = [MetricsPlugin()]
+
+        self.assertFalse(self.manager._sorted)
+
+        kwargs = self.manager.execute_pre_request("GET", "http://example.com")
+
+        self.assertIn('_start_time', kwargs)
+        self.assertEqual(self.manager.get_plugin("metrics").name, "metrics")
+        self.assertIsNone(self.manager.get_plugin("logging"))
+
+    def test_in_place_edits_rebuild_chains(self):
+        """Test that plugins appended to or removed from the list are picked up."""
+        self.manager.register_plugin(LoggingPlugin)
+        metrics = MetricsPlugin()
+        self.manager.plugins.append(metrics)
+
+        kwargs = self.manager.execute_pre_request("GET", "http://example.com")
+
+        self.assertIn('_start_time', kwargs)
+        self.assertIs(self.manager.get_plugin("metrics"), metrics)
+
+        self.manager.plugins.remove(metrics)
+
+        kwargs = self.manager.execute_pre_request("GET", "http://example.com")
+
+        self.assertNotIn('_start_time', kwargs)
+        self.assertIsNone(self.manager.get_plugin("metrics"))
+
+    def test_hook_chains_skip_noop_plugins(self):
+        """Test that hook chains only contain plugins overriding the hook."""
+        self.manager.register_plugin(RateLimitPlugin)
+        self.manager.register_plugin(MetricsPlugin)
+
+        rate_limit = self.manager.get_plugin("rate_limit")
+        metrics = self.manager.get_plugin("metrics")
+
+        self.assertIn(rate_limit, self.manager._pre_chain)
+        self.assertNotIn(rate_limit, self.manager._post_chain)
+        self.assertIn(metrics, self.manager._post_chain)
+        self.assertNotIn(rate_limit, self.manager._error_chain)
+        self.assertIn(metrics, self.manager._error_chain)
+
+        self.assertTrue(rate_limit._has_pre)
+        self.assertFalse(rate_limit._has_post)
+        self.assertFalse(rate_limit._has_error)
+
+    def test_hook_chains_follow_priority(self):
+        """Test that hook chains are ordered by priority."""
+        self.manager.register_plugin(LoggingPlugin)
+        self.manager.register_plugin(MetricsPlugin)
+        self.manager.get_plugin("logging").priority = 200
+        self.manager.sort_plugins()
+
+        self.assertEqual([p.name for p in self.manager._pre_chain], ["metrics", "logging"])
+
     def test_execute_pre_request(self):
         """Test pre-request hook execution."""
         self.manager.register_plugin(MetricsPlugin)
@@ -334,6 +549,182 @@ class TestPluginManager(unittest.TestCase):
 
         self.assertEqual(result, error)
 
+    def test_execute_pre_request_mutates_in_place(self):
+        """Test that plugins share a single kwargs dict."""
+        seen = []
+
+        class RecordingPlugin(HTTPWrapperPlugin):
+            def initialize(self, config):
+                pass
+
+            def pre_request(self, method, url, kwargs):
+                seen.append(kwargs)
+                kwargs['recorded'] = True
+
+        self.manager.register_plugin(RecordingPlugin)
+        self.manager.register_plugin(MetricsPlugin)
+
+        kwargs = self.manager.execute_pre_request("GET", "http://example.com")
+
+        self.assertIs(seen[0], kwargs)
+        self.assertTrue(kwargs['recorded'])
+        self.assertIn('_start_time', kwargs)
+
+    def test_execute_pre_request_legacy_plugin(self):
+        """Test that plugins returning new kwargs are still supported."""
+        class LegacyPlugin(HTTPWrapperPlugin):
+            def initialize(self, config):
+                pass
+
+            def pre_request(self, method, url, **kwargs):
+                kwargs.pop('drop', None)
+                kwargs['legacy'] = method
+                return kwargs
+
+        self.manager.register_plugin(LegacyPlugin)
+
+        kwargs = self.manager.execute_pre_request("GET", "http://example.com", drop=1, keep=2)
+
+        self.assertEqual(kwargs, {'keep': 2, 'legacy': "GET"})
+
+    def test_execute_pre_request_independent_plugins(self):
+        """Test that independent plugins run concurrently and are merged."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def make_plugin(plugin_name, header):
+            class IndependentPlugin(HTTPWrapperPlugin):
+                independent = True
+
+                def __init__(self):
+                    super().__init__()
+                    self.name = plugin_name
+
+                def initialize(self, config):
+                    pass
+
+                def pre_request(self, method, url, kwargs):
+                    # Both hooks must be running at once to pass the barrier
+                    barrier.wait()
+                    kwargs['headers'][header] = plugin_name
+
+            return IndependentPlugin
+
+        self.manager.register_plugin(make_plugin("sign", "X-Signature"))
+        self.manager.register_plugin(make_plugin("trace", "X-Trace-Id"))
+        self.manager.register_plugin(MetricsPlugin)
+
+        kwargs = self.manager.execute_pre_request(
+            "GET", "http://example.com", headers={"Accept": "application/json"}
+        )
+
+        self.assertEqual(kwargs['headers'], {
+            "Accept": "application/json",
+            "X-Signature": "sign",
+            "X-Trace-Id": "trace",
+        })
+        self.assertIn('_start_time', kwargs)
+        self.assertEqual(len(self.manager._pre_stages), 2)
+
+        self.manager.shutdown_all()
+        self.assertIsNone(self.manager._executor)
+
+    def test_execute_pre_request_independent_merge_changes_only(self):
+        """Test that untouched copies do not undo changes from other hooks."""
+        class ChangingPlugin(HTTPWrapperPlugin):
+            independent = True
+
+            def initialize(self, config):
+                pass
+
+            def pre_request(self, method, url, kwargs):
+                kwargs['timeout'] = 5
+                kwargs.pop('secret')
+                del kwargs['headers']['X-Drop']
+
+        class IdlePlugin(HTTPWrapperPlugin):
+            independent = True
+
+            def __init__(self):
+                super().__init__()
+                self.name = "idle"
+
+            def initialize(self, config):
+                pass
+
+            def pre_request(self, method, url, kwargs):
+                pass
+
+        self.manager.register_plugin(ChangingPlugin)
+        self.manager.register_plugin(IdlePlugin)
+
+        kwargs = self.manager.execute_pre_request(
+            "GET", "http://example.com", timeout=30, secret="s",
+            headers={"X-Drop": "1", "X-Keep": "2"}
+        )
+
+        self.assertEqual(kwargs, {'timeout': 5, 'headers': {"X-Keep": "2"}})
+        self.manager.shutdown_all()
+
+    def test_execute_pre_request_independent_priority_order(self):
+        """Test that independent hooks run at their place in priority order."""
+        def make_plugin(plugin_name, priority, independent):
+            class OrderedPlugin(HTTPWrapperPlugin):
+                def __init__(self):
+                    super().__init__()
+                    self.name = plugin_name
+                    self.priority = priority
+                    self.independent = independent
+
+                def initialize(self, config):
+                    pass
+
+                def pre_request(self, method, url, kwargs):
+                    kwargs['params'][plugin_name] = sorted(kwargs['params'])
+
+            return OrderedPlugin
+
+        self.manager.register_plugin(make_plugin("first", 10, False))
+        self.manager.register_plugin(make_plugin("left", 20, True))
+        self.manager.register_plugin(make_plugin("right", 20, True))
+        self.manager.register_plugin(make_plugin("last", 30, False))
+
+        kwargs = self.manager.execute_pre_request("GET", "http://example.com", params={})
+
+        # Both concurrent hooks see the serial hook before them and only that,
+        # each keeps its own nested changes, and the last hook sees them all
+        self.assertEqual(kwargs['params'], {
+            'first': [],
+            'left': ['first'],
+            'right': ['first'],
+            'last': ['first', 'left', 'right'],
+        })
+        self.manager.shutdown_all()
+
+    def test_execute_pre_request_legacy_plugin_calling_super(self):
+        """Test that legacy plugins may delegate to the base pre_request."""
+        class LegacySuperPlugin(HTTPWrapperPlugin):
+            def initialize(self, config):
+                pass
+
+            def pre_request(self, method, url, **kwargs):
+                kwargs['legacy'] = True
+                return super().pre_request(method, url, **kwargs)
+
+        self.manager.register_plugin(LegacySuperPlugin)
+
+        kwargs = self.manager.execute_pre_request("GET", "http://example.com", headers={})
+
+        self.assertEqual(kwargs, {'headers': {}, 'legacy': True})
+
+    def test_builtin_pre_request_legacy_call(self):
+        """Test that built-in hooks still support the legacy call form."""
+        kwargs = MetricsPlugin().pre_request("GET", "http://example.com", headers={})
+
+        self.assertIn('_start_time', kwargs)
+        self.assertEqual(kwargs['headers'], {})
+
     def test_get_all_metrics(self):
         """Test getting metrics from all plugins."""
         self.manager.register_plugin(MetricsPlugin)
@@ -356,6 +747,141 @@ class TestPluginManager(unittest.TestCase):
         self.assertEqual(len(self.manager.plugins), 0)
 
 
+class TestPluginAdapter(unittest.TestCase):
+    """Test cases for PluginAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = PluginManager()
+        self.session = requests.Session()
+        self.session.mount("http://", PluginAdapter(self.manager))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.session.close()
+
+    def _make_response(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"ok"
+        response.request = request
+        response.url = request.url
+        return response
+
+    def test_adapter_runs_hooks(self):
+        """Test that pre and post hooks run around the transport."""
+        class HeaderPlugin(HTTPWrapperPlugin):
+            def initialize(self, config):
+                pass
+
+            def pre_request(self, method, url, kwargs):
+                kwargs['headers']['X-Plugin'] = method
+                kwargs['_private'] = True
+
+            def post_request(self, response):
+                response.tagged = True
+                return response
+
+        self.manager.register_plugin(HeaderPlugin)
+
+        with patch.object(HTTPAdapter, 'send', autospec=True,
+                          side_effect=lambda adapter, request, **kw: self._make_response(request)) as send:
+            response = self.session.get("http://example.com")
+
+        sent_request = send.call_args[0][1]
+        self.assertEqual(sent_request.headers['X-Plugin'], "GET")
+        self.assertNotIn('_private', send.call_args[1])
+        self.assertTrue(response.tagged)
+
+    def test_adapter_skips_unused_phases(self):
+        """Test that phases without plugins are not dispatched."""
+        self.manager.register_plugin(RateLimitPlugin)
+
+        self.assertTrue(self.manager.has_pre)
+        self.assertFalse(self.manager.has_post)
+        self.assertFalse(self.manager.has_error)
+
+        with patch.object(HTTPAdapter, 'send', autospec=True,
+                          side_effect=lambda adapter, request, **kw: self._make_response(request)):
+            with patch.object(self.manager, 'execute_post_request') as post:
+                self.session.get("http://example.com")
+
+        post.assert_not_called()
+
+    def test_adapter_records_metrics(self):
+        """Test that MetricsPlugin records response times through the adapter."""
+        self.manager.register_plugin(MetricsPlugin)
+
+        with patch.object(HTTPAdapter, 'send', autospec=True,
+                          side_effect=lambda adapter, request, **kw: self._make_response(request)):
+            for _ in range(3):
+                self.session.get("http://example.com")
+
+        metrics = self.manager.get_plugin("metrics")
+        self.assertEqual(metrics.request_count, 3)
+        self.assertEqual(len(metrics.response_times), 3)
+
+    def test_adapter_routes_pre_request_errors(self):
+        """Test that errors raised by pre hooks reach the error hooks."""
+        from httpwrapper.exceptions import RateLimitError
+
+        self.manager.register_plugin(MetricsPlugin)
+        self.manager.register_plugin(RateLimitPlugin, {'max_requests': 1, 'window_seconds': 60})
+
+        with patch.object(HTTPAdapter, 'send', autospec=True,
+                          side_effect=lambda adapter, request, **kw: self._make_response(request)):
+            self.session.get("http://example.com")
+            with self.assertRaises(RateLimitError):
+                self.session.get("http://example.com")
+
+        self.assertEqual(self.manager.get_plugin("metrics").error_count, 1)
+
+    def test_adapter_routes_errors(self):
+        """Test that transport errors go through the error hooks."""
+        class WrapErrorPlugin(HTTPWrapperPlugin):
+            def initialize(self, config):
+                pass
+
+            def on_error(self, error, method, url):
+                return RuntimeError(f"wrapped: {error}")
+
+        self.manager.register_plugin(WrapErrorPlugin)
+
+        with patch.object(HTTPAdapter, 'send', side_effect=requests.ConnectionError("down")):
+            with self.assertRaises(RuntimeError) as ctx:
+                self.session.get("http://example.com")
+
+        self.assertIsInstance(ctx.exception.__cause__, requests.ConnectionError)
+
+    def test_adapter_runs_hooks_per_redirect(self):
+        """Test that every redirect hop passes through the hooks."""
+        self.manager.register_plugin(MetricsPlugin)
+
+        def redirect_once(adapter, request, **kw):
+            response = self._make_response(request)
+            if request.url.endswith("/old"):
+                response.status_code = 302
+                response.headers['Location'] = "http://example.com/new"
+            response._content_consumed = True
+            return response
+
+        with patch.object(HTTPAdapter, 'send', autospec=True, side_effect=redirect_once):
+            response = self.session.get("http://example.com/old")
+
+        self.assertEqual(response.url, "http://example.com/new")
+        metrics = self.manager.get_plugin("metrics")
+        self.assertEqual(metrics.request_count, 2)
+        self.assertEqual(metrics.status_codes, {302: 1, 200: 1})
+
+    def test_adapter_forwards_pool_settings(self):
+        """Test that pool sizes reach the underlying HTTPAdapter."""
+        adapter = PluginAdapter(self.manager, pool_connections=4, pool_maxsize=32)
+
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw['maxsize'], 32)
+
+
 class TestPluginIntegration(unittest.TestCase):
     """Test cases for plugin integration and interaction."""
 